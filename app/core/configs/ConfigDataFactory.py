@@ -88,6 +88,12 @@ class ConfigDataFactory:
                 passing_test_ratio=task_profile_dict[
                     ConfigFieldsEnum.PASSING_TEST_RATIO.value
                 ],
+                parallel_build=task_profile_dict.get(
+                    ConfigFieldsEnum.PARALLEL_BUILD.value, False
+                ),
+                dependency_cache=task_profile_dict.get(
+                    ConfigFieldsEnum.DEPENDENCY_CACHE.value, False
+                ),
             )
             for k, v in task_profile_dict.items():
                 if not hasattr(profile, k):
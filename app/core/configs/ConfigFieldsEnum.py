@@ -20,6 +20,8 @@ class ConfigFieldsEnum(Enum):
     PATCH_DIRECTORY = "patch-directory"
     PASSING_TEST_LIMIT = "passing-test-limit"
     FAILING_TEST_LIMIT = "failing-test-limit"
+    PARALLEL_BUILD = "parallel-build"
+    DEPENDENCY_CACHE = "dependency-cache"
 
     CPU_COUNT = "cpu-count"
     GPU_COUNT = "gpu-count"
@@ -58,6 +58,8 @@ task_profile_schema = {
             "minimum": 0,
         },
         ConfigFieldsEnum.PATCH_DIRECTORY.value: {"type": "string"},
+        ConfigFieldsEnum.PARALLEL_BUILD.value: {"type": "boolean"},
+        ConfigFieldsEnum.DEPENDENCY_CACHE.value: {"type": "boolean"},
     },
     "required": [
         ConfigFieldsEnum.PROFILE_ID.value,
@@ -10,6 +10,8 @@ class TaskProfile(AbstractProfile):
         passing_test_ratio: float,
         test_timeout: int = 10,
         patch_directory: str = "",
+        parallel_build: bool = False,
+        dependency_cache: bool = False,
     ):
         super().__init__(profile_id)
         self.timeout = timeout
@@ -17,3 +19,5 @@ class TaskProfile(AbstractProfile):
         self.passing_test_ratio = passing_test_ratio
         self.test_timeout = test_timeout
         self.patch_directory = patch_directory
+        self.parallel_build = parallel_build
+        self.dependency_cache = dependency_cache
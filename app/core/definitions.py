@@ -40,6 +40,8 @@ KEY_CONFIG_TIMEOUT_TESTCASE = "test_timeout"
 KEY_CONFIG_FIX_LOC = "fault_location"
 KEY_CONFIG_PATCH_DIR = "patch_directory"
 KEY_CONFIG_TEST_RATIO = "passing_test_ratio"
+KEY_CONFIG_PARALLEL_BUILD = "parallel_build"
+KEY_CONFIG_DEPENDENCY_CACHE = "dependency_cache"
 KEY_BINARY_PATH = "binary_path"
 KEY_COUNT_NEG = "count_neg"
 KEY_COUNT_POS = "count_pos"
@@ -135,7 +135,9 @@ def run(
                 )
 
             container_id = container.create_running_container(
-                construct_container_volumes(dir_info, tool.bindings),
+                construct_container_volumes(
+                    dir_info, tool.get_bindings(task_config_info)
+                ),
                 task_image,
                 task_identifier,
                 cpu,
@@ -3,6 +3,7 @@ import os
 import re
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from os.path import join
 from typing import Any
@@ -96,6 +97,8 @@ class AbstractTool(AbstractDriver):
     key_crash_cmd = definitions.KEY_CRASH_CMD
     key_exploit_list = definitions.KEY_EXPLOIT_LIST
     key_config_timeout_test = definitions.KEY_CONFIG_TIMEOUT_TESTCASE
+    key_parallel_build = definitions.KEY_CONFIG_PARALLEL_BUILD
+    key_dependency_cache = definitions.KEY_CONFIG_DEPENDENCY_CACHE
     key_dependencies = definitions.KEY_DEPENDENCIES
     key_java_version = definitions.KEY_JAVA_VERSION
     key_generator = definitions.KEY_GENERATOR
@@ -394,6 +397,10 @@ class AbstractTool(AbstractDriver):
         if container_stats:
             self.stats.container_stats.load_container_stats(container_stats)
 
+    def get_bindings(self, task_config_info: Dict[str, Any]) -> Dict[str, Any]:
+        """volumes to mount in the tool container for the given task profile"""
+        return self.bindings
+
     def update_dir_info(self, dir_info: DirectoryInfo) -> None:
         if self.container_id:
             self.dir_expr = dir_info["container"]["experiment"]
@@ -486,6 +493,26 @@ class AbstractTool(AbstractDriver):
         self.command_history.append((dir_path, command, temp_env))
         return exit_code
 
+    def run_commands(
+        self,
+        commands: Sequence[Tuple[str, str]],
+        dir_path: Optional[str] = None,
+        env: Dict[str, str] = dict(),
+        parallel: bool = False,
+    ) -> List[int]:
+        """executes the (command, log_file) pairs at the given dir_path, concurrently if parallel is set"""
+        if not parallel or len(commands) < 2:
+            return [
+                self.run_command(command, log_file_path, dir_path, env)
+                for command, log_file_path in commands
+            ]
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            futures = [
+                executor.submit(self.run_command, command, log_file_path, dir_path, env)
+                for command, log_file_path in commands
+            ]
+            return [f.result() for f in futures]
+
     def exec_command(
         self,
         command: str,
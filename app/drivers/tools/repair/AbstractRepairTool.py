@@ -1,15 +1,20 @@
 import abc
+import hashlib
 import os
+import random
+import shlex
 import shutil
 from datetime import datetime
 from os.path import join
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from app.core import container
 from app.core import definitions
 from app.core import utilities
+from app.core import values
 from app.core.task.stats.RepairToolStats import RepairToolStats
 from app.core.task.typing.DirectoryInfo import DirectoryInfo
 from app.core.utilities import error_exit
@@ -19,6 +24,15 @@ from app.drivers.tools.AbstractTool import AbstractTool
 
 class AbstractRepairTool(AbstractTool):
     stats: RepairToolStats
+    dir_maven_dependency_cache = "/opt/maven-dependency-cache"
+    dir_maven_dependency_cache_host = join(values.dir_dynamic, "maven-dependency-cache")
+    maven_dependency_cache_marker = ".complete"
+    uses_maven_dependency_cache = False
+    # plugins that fail the build of many subjects without affecting the compiled classes
+    maven_skip_plugins = (
+        "-Dcheckstyle.skip=true -Denforcer.skip=true -Dspotbugs.skip=true "
+        "-Dforbiddenapis.skip=true -Dlicense.skip=true -DskipITs"
+    )
 
     def __init__(self, tool_name: str) -> None:
         self.stats = RepairToolStats()
@@ -72,6 +86,77 @@ class AbstractRepairTool(AbstractTool):
             hash,
         )
 
+    def get_bindings(self, task_config_info: Dict[str, Any]) -> Dict[str, Any]:
+        """mount the host dependency cache so it outlives the container of each bug"""
+        if not (
+            self.uses_maven_dependency_cache
+            and task_config_info.get(self.key_dependency_cache, False)
+        ):
+            return self.bindings
+        os.makedirs(self.dir_maven_dependency_cache_host, exist_ok=True)
+        return {
+            **self.bindings,
+            self.dir_maven_dependency_cache_host: {
+                "bind": self.dir_maven_dependency_cache,
+                "mode": "rw",
+            },
+        }
+
+    def get_maven_dependency_cache_dir(
+        self, project_dir: str, project_name: str
+    ) -> Optional[str]:
+        """
+        Folder shared by all bugs of the same maven project to hold its copied dependencies,
+        keyed by the project name and the hash of its pom.xml
+        """
+        pom_path = join(project_dir, "pom.xml")
+        if not self.is_file(pom_path):
+            return None
+        # iso-8859-1 maps every byte, so any pom encoding hashes without decoding errors
+        pom_hash = hashlib.sha256(
+            "".join(self.read_file(pom_path, encoding="iso-8859-1")).encode(
+                "iso-8859-1"
+            )
+        ).hexdigest()
+        return join(
+            (
+                self.dir_maven_dependency_cache
+                if self.container_id
+                else self.dir_maven_dependency_cache_host
+            ),
+            "{}-{}".format(project_name or "project", pom_hash),
+        )
+
+    def is_maven_dependency_cache_complete(self, dir_cache: str) -> bool:
+        return self.is_file(join(dir_cache, self.maven_dependency_cache_marker))
+
+    def get_maven_dependency_staging_dir(self, dir_cache: str) -> str:
+        """folder receiving the copy before it is published as the cache folder"""
+        return "{}.partial-{}".format(dir_cache, random.randint(0, 1000000))
+
+    def complete_maven_dependency_cache(
+        self, dir_staging: str, dir_cache: str, copy_status: int
+    ) -> bool:
+        """
+        Publish a successful copy as the cache folder by marking it complete and renaming it,
+        failed or interrupted copies are discarded and never reused
+        """
+        if copy_status == 0:
+            publish_script = 'touch "$1/{}" && mv -T "$1" "$2"'.format(
+                self.maven_dependency_cache_marker
+            )
+            self.run_command(
+                shlex.join(["bash", "-c", publish_script, "_", dir_staging, dir_cache])
+            )
+        else:
+            self.emit_warning(
+                "copying the maven dependencies failed, not updating the dependency cache"
+            )
+        # the staging folder is left over when the copy failed or another bug
+        # published the cache first
+        self.run_command(shlex.join(["rm", "-rf", dir_staging]))
+        return self.is_maven_dependency_cache_complete(dir_cache)
+
     def create_meta_data(self) -> None:
         self.write_json(
             [{"patches_dir": join(self.dir_output, "patches")}],
@@ -1,26 +1,260 @@
+import glob
 import math
-import re
+import mmap
 import os
+import random
+import re
+import shlex
+import stat
 from os.path import join
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
+from app.core import container
 from app.core.task.stats.RepairToolStats import RepairToolStats
 from app.core.task.typing.DirectoryInfo import DirectoryInfo
 from app.drivers.tools.repair.AbstractRepairTool import AbstractRepairTool
 
+_ID_RE = re.compile(rb"id (.*)")
+_EVENT_RE = re.compile(rb"(?i)(?P<compiles>child compiles)|found solution,")
+
+
+def _to_astor_test(test_identifier: str) -> str:
+    """convert a failing test identifier to the Class#method or Class form Astor expects"""
+    # Keep method references and pure class names (common when only the class fails)
+    if "#" in test_identifier or test_identifier.endswith(("Test", "Tests", "ITCase")):
+        return test_identifier
+    cls, _, method = test_identifier.rpartition(".")
+    return f"{cls}#{method}" if cls and method else test_identifier
+
+
+def _newest_mtime(dir_path: str, suffix: str) -> Optional[float]:
+    """modification time of the newest file ending with suffix under dir_path"""
+    return max(
+        (
+            os.stat(join(root, f)).st_mtime
+            for root, _, files in os.walk(dir_path)
+            for f in files
+            if f.endswith(suffix)
+        ),
+        default=None,
+    )
+
+
+def _edge_lines(buffer: mmap.mmap) -> Tuple[bytes, bytes]:
+    """return the first and last line of the buffer without scanning the lines in between"""
+    first_end = buffer.find(b"\n")
+    first_line = buffer[: first_end if first_end != -1 else len(buffer)]
+    last_end = len(buffer)
+    if buffer[last_end - 1 : last_end] == b"\n":
+        last_end -= 1
+    last_line = buffer[buffer.rfind(b"\n", 0, last_end) + 1 : last_end]
+    return first_line, last_line
 
-class AstorTool(AbstractRepairTool):
 
+class AstorTool(AbstractRepairTool):
     astor_home = "/opt/astor"
     astor_version = "2.0.0"
     mode: Optional[str] = None
+    uses_maven_dependency_cache = True
+    # the JVMs installed in an image do not change, resolve their bin folder once
+    _jvm_bin_dir_cache: Dict[Tuple[str, int], str] = {}
 
     def __init__(self) -> None:
         super().__init__(self.name)
         self.image_name = "rshariffdeen/astor"
+        self._fs_cache: Dict[str, Tuple[bool, bool, bool]] = {}
+        self._ls_cache: Dict[str, List[str]] = {}
+
+    def _probe_path(self, path: str) -> Tuple[bool, bool, bool]:
+        """stat the path once and memoize its (exists, is_file, is_dir) triple"""
+        if path not in self._fs_cache:
+            if self.container_id:
+                _, output = self.exec_command(
+                    shlex.join(["stat", "-L", "-c", "%F", path])
+                )
+                kind = ""
+                if output and output[0]:
+                    kind = output[0].decode("utf-8", "ignore").strip()
+                self._fs_cache[path] = (
+                    kind != "",
+                    kind.startswith("regular"),
+                    kind == "directory",
+                )
+            else:
+                try:
+                    mode = os.stat(path).st_mode
+                    self._fs_cache[path] = (
+                        True,
+                        stat.S_ISREG(mode),
+                        stat.S_ISDIR(mode),
+                    )
+                except OSError:
+                    self._fs_cache[path] = (False, False, False)
+        return self._fs_cache[path]
+
+    def _batch_exists(self, paths: List[str]) -> Set[str]:
+        """probe all uncached paths with a single command and return the existing ones"""
+        pending = [p for p in dict.fromkeys(paths) if p not in self._fs_cache]
+        if pending and self.container_id:
+            probe_script = (
+                'for p in "$@"; do '
+                'if [ -d "$p" ]; then echo "d $p"; '
+                'elif [ -f "$p" ]; then echo "f $p"; '
+                'elif [ -e "$p" ]; then echo "e $p"; fi; '
+                "done"
+            )
+            probe_command = shlex.join(["sh", "-c", probe_script, "_", *pending])
+            _, output = self.exec_command(probe_command)
+            found: Dict[str, str] = {}
+            if output and output[0]:
+                for line in output[0].decode("utf-8", "ignore").splitlines():
+                    kind, _, path = line.partition(" ")
+                    found[path] = kind
+            for path in pending:
+                kind = found.get(path, "")
+                self._fs_cache[path] = (kind != "", kind == "f", kind == "d")
+        return {p for p in paths if self._probe_path(p)[0]}
+
+    def _find_jars(self, dirs: List[str]) -> List[str]:
+        """list the jar files directly inside the given directories with a single find"""
+        if not dirs:
+            return []
+        if self.container_id:
+            find_command = shlex.join(
+                ["find", *dirs, "-maxdepth", "1", "-type", "f", "-name", "*.jar"]
+            )
+            _, output = self.exec_command(find_command)
+            if not output or not output[0]:
+                return []
+            # one path per line, paths may contain spaces
+            return output[0].decode("utf-8", "ignore").splitlines()
+        jar_list: List[str] = []
+        for dir_path in dirs:
+            if not os.path.isdir(dir_path):
+                continue
+            with os.scandir(dir_path) as entries:
+                jar_list += [
+                    e.path for e in entries if e.name.endswith(".jar") and e.is_file()
+                ]
+        return jar_list
+
+    def _needs_recompile(self, src_dir: str, bin_dir: str) -> bool:
+        """check whether the newest source is newer than the newest compiled class"""
+        if not self._cached_is_dir(bin_dir):
+            return True
+        # the bin_dir mtime only moves when direct children change, so compare
+        # against the classes themselves
+        if self.container_id:
+            newest_script = (
+                'newest() { find "$1" -type f -name "$2" -printf \'%T@\\n\' '
+                "| sort -n | tail -n 1; }; "
+                'echo "$(newest "$1" \'*.java\')|$(newest "$2" \'*.class\')"'
+            )
+            _, output = self.exec_command(
+                shlex.join(["sh", "-c", newest_script, "_", src_dir, bin_dir])
+            )
+            newest_src, _, newest_class = (
+                output[0].decode("utf-8", "ignore").strip()
+                if output and output[0]
+                else ""
+            ).partition("|")
+            if not newest_src:
+                return False
+            return not newest_class or float(newest_src) > float(newest_class)
+        newest_src_mtime = _newest_mtime(src_dir, ".java")
+        if newest_src_mtime is None:
+            return False
+        newest_class_mtime = _newest_mtime(bin_dir, ".class")
+        return newest_class_mtime is None or newest_src_mtime > newest_class_mtime
+
+    def _find_sub_project(self, base_dir: str) -> Optional[str]:
+        """locate the maven sub project directly below base_dir with a single find, preferring one named after java"""
+        if self.container_id:
+            _, output = self.exec_command(
+                shlex.join(
+                    ["find", base_dir, "-mindepth", "2", "-maxdepth", "2"]
+                    + ["-name", "pom.xml"]
+                )
+            )
+            pom_paths = (
+                sorted(output[0].decode("utf-8", "ignore").splitlines())
+                if output and output[0]
+                else []
+            )
+        else:
+            pom_paths = sorted(glob.glob(join(glob.escape(base_dir), "*", "pom.xml")))
+        sub_project_dirs = [os.path.dirname(p) for p in pom_paths]
+        return next(
+            (d for d in sub_project_dirs if "java" in os.path.basename(d).lower()),
+            sub_project_dirs[0] if sub_project_dirs else None,
+        )
+
+    def _fetch_log(self, log_path: str) -> str:
+        """return a host path for the log, copying it out of the container if needed"""
+        if not self.container_id:
+            return log_path
+        tmp_log_path = join("/tmp", "astor-log-{}".format(random.randint(0, 1000000)))
+        container.copy_file_from_container(self.container_id, log_path, tmp_log_path)
+        return tmp_log_path
+
+    def _count_log_events(self, log_map: mmap.mmap) -> Tuple[int, int, int]:
+        """count compilable children, the highest child id and plausible solutions in the log"""
+        count_compilable = 0
+        count_enumerations = 0
+        count_plausible = 0
+        # a single case-insensitive scan in the regex engine instead of lowering
+        # every line, Astor logs "The child compiles" and "Found Solution," in mixed case
+        position = 0
+        while True:
+            event = _EVENT_RE.search(log_map, position)
+            if not event:
+                break
+            line_start = log_map.rfind(b"\n", 0, event.start()) + 1
+            line_end = log_map.find(b"\n", event.end())
+            if line_end == -1:
+                line_end = len(log_map)
+            position = line_end + 1
+            if not event.group("compiles"):
+                count_plausible += 1
+                continue
+            count_compilable += 1
+            identifier = _ID_RE.search(log_map, line_start, line_end)
+            if not identifier:
+                self.emit_warning("No Id found")
+                continue
+            child_id = int(identifier.group(1).strip())
+            if child_id > count_enumerations:
+                count_enumerations = child_id
+        return count_compilable, count_enumerations, count_plausible
+
+    def _cached_is_dir(self, dir_path: str) -> bool:
+        return self._probe_path(dir_path)[2]
+
+    def _cached_is_file(self, file_path: str) -> bool:
+        return self._probe_path(file_path)[1]
+
+    def _cached_list_dir(self, dir_path: str) -> List[str]:
+        if dir_path not in self._ls_cache:
+            self._ls_cache[dir_path] = (
+                self.list_dir(dir_path) if self._cached_is_dir(dir_path) else []
+            )
+        return self._ls_cache[dir_path]
+
+    def _invalidate_fs_cache(self, dir_path: Optional[str] = None) -> None:
+        """drop cached probes under dir_path (or everything) after a command modified the file system"""
+        if dir_path is None:
+            self._fs_cache.clear()
+            self._ls_cache.clear()
+            return
+        prefix = dir_path.rstrip("/") + "/"
+        for cache in (self._fs_cache, self._ls_cache):
+            for path in [p for p in cache if p == dir_path or p.startswith(prefix)]:
+                del cache[path]
 
     def invoke(
         self, bug_info: Dict[str, Any], task_config_info: Dict[str, Any]
@@ -31,9 +265,10 @@ class AstorTool(AbstractRepairTool):
         self.dir_expr - directory for experiment
         self.dir_output - directory to store artifacts/output
         """
+        self._invalidate_fs_cache()
 
         timeout_h = str(task_config_info[self.key_timeout])
-        timeout_m = str(float(timeout_h) * 60)
+        timeout_m = int(math.ceil(float(timeout_h) * 60))
         max_gen = 1000000
 
         # Extract relative directory paths from bug info for Java source and binaries
@@ -42,106 +277,229 @@ class AstorTool(AbstractRepairTool):
         dir_java_bin = bug_info[self.key_dir_class]
         dir_test_bin = bug_info[self.key_dir_test_class]
 
+        dir_expr = self.dir_expr
+        astor_lib_dir = join(self.astor_home, "external", "lib")
+
         env = {}
-        java_version = bug_info.get(self.key_java_version, 8)
-        if int(java_version) <= 7:
-            java_version = 8
-        env["JAVA_HOME"] = f"/usr/lib/jvm/java-{java_version}-openjdk-amd64/"
+        # Java 7 and older subjects are run on Java 8
+        java_version = max(int(bug_info.get(self.key_java_version, 8)), 8)
+        java_home = f"/usr/lib/jvm/java-{java_version}-openjdk-amd64/"
+        env["JAVA_HOME"] = java_home
 
         self.run_command(
             "bash {}".format(bug_info.get(self.key_build_script)),
             dir_path=self.dir_setup,
             env=env,
         )
+        # the build script may create any of the directories probed below
+        self._invalidate_fs_cache()
 
-        list_deps = [
-            join(self.dir_expr, dep) for dep in bug_info[self.key_dependencies]
-        ]
-        list_deps += [
-            join(self.astor_home, "external", "lib", "hamcrest-core-1.3.jar"),
-            join(self.astor_home, "external", "lib", "junit-4.12.jar"),
+        # Probe the JVM layout (unless known for this image) and the Astor provided
+        # test libraries in one go
+        jvm_key = (self.image_name, java_version)
+        jvm_bin_dirs = [join(java_home, "jre", "bin"), join(java_home, "bin")]
+        astor_test_jars = [
+            join(astor_lib_dir, "hamcrest-core-1.3.jar"),
+            join(astor_lib_dir, "junit-4.12.jar"),
         ]
+        if jvm_key in self._jvm_bin_dir_cache:
+            existing_paths = self._batch_exists(astor_test_jars)
+        else:
+            existing_paths = self._batch_exists(jvm_bin_dirs + astor_test_jars)
+            self._jvm_bin_dir_cache[jvm_key] = next(
+                (d for d in jvm_bin_dirs if self._cached_is_dir(d)), jvm_bin_dirs[-1]
+            )
+        jvm_bin_dir = self._jvm_bin_dir_cache[jvm_key]
+
+        # dict used as an insertion ordered set to drop duplicate class path entries
+        list_deps: Dict[str, None] = dict.fromkeys(
+            join(dir_expr, dep) for dep in bug_info[self.key_dependencies]
+        )
+        list_deps.update(
+            dict.fromkeys(j for j in astor_test_jars if j in existing_paths)
+        )
+        for jar_path in [j for j in astor_test_jars if j not in existing_paths]:
+            self.emit_warning(f"astor test library not found: {jar_path}")
 
         project_name = bug_info.get(self.key_project_name, "").strip()
         # Adding the submodule path to the experiment directory structure if that exists
-        absolute_directory_path = join(self.dir_expr, "src", "src", project_name) if project_name else join(self.dir_expr, "src")
+        absolute_directory_path = (
+            join(dir_expr, "src", "src", project_name)
+            if project_name
+            else join(dir_expr, "src")
+        )
+        if (
+            not project_name
+            and bug_info[self.key_build_system] == "maven"
+            and not self._cached_is_file(join(absolute_directory_path, "pom.xml"))
+        ):
+            # No project given and no top level pom, look for the maven sub project
+            sub_project_path = self._find_sub_project(
+                join(absolute_directory_path, "src")
+            )
+            if sub_project_path:
+                absolute_directory_path = sub_project_path
+                project_name = os.path.basename(sub_project_path)
+                self.emit_normal(f"using maven sub project {project_name}")
 
         # Ensure the dependencies exist
         if bug_info[self.key_build_system] == "maven":
-            self.run_command(
-                f"mvn dependency:copy-dependencies",
-                dir_path=absolute_directory_path,
-                env=env,
+            # Rebuild when the build script left the classes missing or stale
+            needs_compile = self._needs_recompile(
+                join(absolute_directory_path, dir_java_src),
+                join(absolute_directory_path, dir_java_bin),
+            ) or self._needs_recompile(
+                join(absolute_directory_path, dir_test_src),
+                join(absolute_directory_path, dir_test_bin),
             )
-            # Add common folders for deependencies
-            list_deps += [
-                x
-                for x in self.list_dir(
-                    join(absolute_directory_path, "target", "dependency")
-                )
-                if x.endswith(".jar")
+            # Common folders for the copied dependencies
+            maven_dep_paths = [
+                join(absolute_directory_path, "target", "dependency"),
+                join(absolute_directory_path, "test", "target", "dependency"),
             ]
-            list_deps += [
-                x
-                for x in self.list_dir(
-                    join(absolute_directory_path, "test", "target", "dependency")
+            # copy-dependencies fills target/dependency, skip it when that is populated
+            maven_jars = self._find_jars([maven_dep_paths[0]])
+            if maven_jars:
+                self.emit_normal("maven dependencies already copied, skipping copy")
+            # Otherwise reuse the dependencies copied for an earlier bug of the project
+            dir_dependency_cache = None
+            dir_dependency_staging = None
+            if not maven_jars and task_config_info.get(
+                self.key_dependency_cache, False
+            ):
+                dir_dependency_cache = self.get_maven_dependency_cache_dir(
+                    absolute_directory_path, project_name
                 )
-                if x.endswith(".jar")
-            ]
+                if dir_dependency_cache and self.is_maven_dependency_cache_complete(
+                    dir_dependency_cache
+                ):
+                    maven_jars = self._find_jars([dir_dependency_cache])
+                    self.emit_normal(
+                        f"reusing cached maven dependencies from {dir_dependency_cache}"
+                    )
+                elif dir_dependency_cache:
+                    dir_dependency_staging = self.get_maven_dependency_staging_dir(
+                        dir_dependency_cache
+                    )
+
+            log_dependency_path = join(
+                self.dir_logs, f"{self.name}-mvn-dependencies.log"
+            )
+            maven_commands: List[Tuple[str, str]] = []
+            if needs_compile:
+                maven_commands.append(
+                    (
+                        f"mvn {self.maven_skip_plugins} compile test-compile",
+                        join(self.dir_logs, f"{self.name}-mvn-compile.log"),
+                    )
+                )
+            if not maven_jars:
+                maven_commands.append(
+                    (
+                        "mvn dependency:copy-dependencies"
+                        + (
+                            f" -DoutputDirectory={dir_dependency_staging}"
+                            if dir_dependency_staging
+                            else ""
+                        ),
+                        log_dependency_path,
+                    )
+                )
+            if maven_commands:
+                # compile and copy-dependencies write to disjoint target folders
+                maven_status = self.run_commands(
+                    maven_commands,
+                    dir_path=absolute_directory_path,
+                    env=env,
+                    parallel=task_config_info.get(self.key_parallel_build, False),
+                )
+                if needs_compile and maven_status[0] != 0:
+                    self.emit_warning(
+                        "maven compilation failed, Astor may run on missing or stale classes"
+                    )
+                if (
+                    dir_dependency_cache
+                    and dir_dependency_staging
+                    and not self.complete_maven_dependency_cache(
+                        dir_dependency_staging, dir_dependency_cache, maven_status[-1]
+                    )
+                ):
+                    # copy into the project as if the cache was disabled
+                    self.run_command(
+                        "mvn dependency:copy-dependencies",
+                        log_file_path=log_dependency_path,
+                        dir_path=absolute_directory_path,
+                        env=env,
+                    )
+                    dir_dependency_cache = None
+                self._invalidate_fs_cache(absolute_directory_path)
+            if not dir_dependency_cache:
+                maven_jars = self._find_jars(maven_dep_paths)
+            elif not maven_jars:
+                maven_jars = self._find_jars([dir_dependency_cache])
+            list_deps.update(dict.fromkeys(maven_jars))
 
-        list_deps_str = ":".join(list_deps)
+        list_deps_str = os.pathsep.join(list_deps)
 
         # Normalize failing test identifiers into Astor format (Class#method or Class)
-        failing_tests = bug_info.get(self.key_failing_test_identifiers, [])
-        normalized_failing: List[str] = []
-        for t in failing_tests:
-            if not t:
-                continue
-            if "#" in t:
-                normalized_failing.append(t)
-                continue
-            # Keep pure class names (common when only the class fails)
-            if t.endswith(("Test", "Tests", "ITCase")):
-                normalized_failing.append(t)
-                continue
-            cls, sep, method = t.rpartition(".")
-            if cls and method:
-                normalized_failing.append(f"{cls}#{method}")
-            else:
-                normalized_failing.append(t)
+        normalized_failing = [
+            _to_astor_test(t)
+            for t in bug_info.get(self.key_failing_test_identifiers, [])
+            if t
+        ]
         # Astor expects failing tests separated by the platform path separator (':' on Linux/macOS)
-        failing_arg = (
-            f"-failing {os.pathsep.join(normalized_failing)} "
+        failing_args = (
+            ["-failing", os.pathsep.join(normalized_failing)]
             if normalized_failing
-            else ""
+            else []
         )
-        jvm_bin_dir = os.path.join(env["JAVA_HOME"], "jre", "bin")
-        if not self.is_dir(jvm_bin_dir):
-            jvm_bin_dir = os.path.join(env["JAVA_HOME"], "bin")
 
         # generate patches
         self.timestamp_log_start()
-        repair_command = (
-            f"timeout -k 5m {timeout_h}h "
-            f"java -cp target/astor-{self.astor_version}-jar-with-dependencies.jar "
-            f"fr.inria.main.evolution.AstorMain "
-            f"-mode {self.mode} "
-            + (f"-loglevel DEBUG " if self.is_debug else "-loglevel INFO ")
-            + f"-srcjavafolder {dir_java_src} "
-            f"-srctestfolder {dir_test_src}  "
-            f"-binjavafolder {dir_java_bin} "
-            f"-bintestfolder  {dir_test_bin} "
-            f"-location {absolute_directory_path} "
-            f"-dependencies {list_deps_str} "
-            f"{failing_arg}"
-            f"-faultlocalization gzoltar "
-            f"-jvm4testexecution {jvm_bin_dir} "
-            f"-jvm4evosuitetestexecution {jvm_bin_dir} "
-            f"-javacompliancelevel {java_version} "
-            f"-maxgen {max_gen} "
-            f"-maxtime {int(math.ceil(float(timeout_m)))} "
-            f"-stopfirst false "
-        )
+        # built as an argument list and quoted in one place, so dependency paths
+        # with spaces or shell metacharacters reach Astor unchanged
+        repair_argv = [
+            "timeout",
+            "-k",
+            "5m",
+            f"{timeout_h}h",
+            "java",
+            "-cp",
+            f"target/astor-{self.astor_version}-jar-with-dependencies.jar",
+            "fr.inria.main.evolution.AstorMain",
+            "-mode",
+            str(self.mode),
+            "-loglevel",
+            "DEBUG" if self.is_debug else "INFO",
+            "-srcjavafolder",
+            dir_java_src,
+            "-srctestfolder",
+            dir_test_src,
+            "-binjavafolder",
+            dir_java_bin,
+            "-bintestfolder",
+            dir_test_bin,
+            "-location",
+            absolute_directory_path,
+            "-dependencies",
+            list_deps_str,
+            *failing_args,
+            "-faultlocalization",
+            "gzoltar",
+            "-jvm4testexecution",
+            jvm_bin_dir,
+            "-jvm4evosuitetestexecution",
+            jvm_bin_dir,
+            "-javacompliancelevel",
+            str(java_version),
+            "-maxgen",
+            str(max_gen),
+            "-maxtime",
+            str(timeout_m),
+            "-stopfirst",
+            "false",
+        ]
+        repair_command = shlex.join(repair_argv)
 
         status = self.run_command(
             repair_command, self.log_output_path, self.astor_home, env=env
@@ -187,45 +545,53 @@ class AstorTool(AbstractRepairTool):
             self.stats.time_stats.timestamp_plausible
         """
         self.emit_normal("reading output")
+        self._invalidate_fs_cache()
 
         count_plausible = 0
         count_enumerations = 0
         count_compilable = 0
 
-        # count number of patch files
-        list_output_dir = self.list_dir(self.dir_output)
-        self.stats.patch_stats.generated = len(
-            [name for name in list_output_dir if ".patch" in name]
-        )
-
         # extract information from output log
-        if not self.log_output_path or not self.is_file(self.log_output_path):
+        if not self.log_output_path or not self._cached_is_file(self.log_output_path):
             self.emit_warning("no output log file found")
+            # count number of patch files, only needed when the diff folder is not read
+            list_output_dir = self._cached_list_dir(self.dir_output)
+            self.stats.patch_stats.generated = len(
+                [name for name in list_output_dir if ".patch" in name]
+            )
             return self.stats
 
         self.emit_highlight(f"output log file: {self.log_output_path}")
 
-        if self.is_file(self.log_output_path):
-            log_lines = self.read_file(self.log_output_path, encoding="iso-8859-1")
-            self.stats.time_stats.timestamp_start = log_lines[0].replace("\n", "")
-            self.stats.time_stats.timestamp_end = log_lines[-1].replace("\n", "")
-            for line in log_lines:
-                if "child compiles" in line.lower():
-                    count_compilable += 1
-                    identifier = re.search(r"id (.*)", line)
-                    if not identifier:
-                        self.emit_warning("No Id found")
-                        continue
-                    child_id = int(str(identifier.group(1)).strip())
-                    if child_id > count_enumerations:
-                        count_enumerations = child_id
-                elif "found solution," in line.lower():
-                    count_plausible += 1
+        log_path = self._fetch_log(self.log_output_path)
+        first_line = last_line = b""
+        try:
+            with open(log_path, "rb") as log_file:
+                # mmap refuses empty files, an empty log has nothing to count
+                if os.fstat(log_file.fileno()).st_size:
+                    with mmap.mmap(
+                        log_file.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as log_map:
+                        first_line, last_line = _edge_lines(log_map)
+                        (
+                            count_compilable,
+                            count_enumerations,
+                            count_plausible,
+                        ) = self._count_log_events(log_map)
+        finally:
+            if log_path != self.log_output_path:
+                os.remove(log_path)
+        self.stats.time_stats.timestamp_start = first_line.decode("iso-8859-1").rstrip(
+            "\r\n"
+        )
+        self.stats.time_stats.timestamp_end = last_line.decode("iso-8859-1").rstrip(
+            "\r\n"
+        )
 
         self.stats.patch_stats.generated = len(
             [
                 x
-                for x in self.list_dir(join(self.astor_home, "diffSolutions"))
+                for x in self._cached_list_dir(join(self.astor_home, "diffSolutions"))
                 if ".diff" in x
             ]
         )
@@ -1,4 +1,5 @@
 import os
+import shlex
 from os.path import join
 from typing import Any
 from typing import Dict
@@ -7,6 +8,8 @@ from app.drivers.tools.repair.AbstractRepairTool import AbstractRepairTool
 
 
 class RepairLlama(AbstractRepairTool):
+    uses_maven_dependency_cache = True
+
     def __init__(self) -> None:
         self.name = os.path.basename(__file__)[:-3].lower()
         super(RepairLlama, self).__init__(self.name)
@@ -38,29 +41,91 @@ class RepairLlama(AbstractRepairTool):
         patch_directory = join(self.dir_output, "patches")
 
         env = {}
-        java_version = bug_info.get(self.key_java_version, 8)
-        if int(java_version) <= 7:
-            java_version = 8
+        # Java 7 and older subjects are run on Java 8
+        java_version = max(int(bug_info.get(self.key_java_version, 8)), 8)
         env["JAVA_HOME"] = f"/usr/lib/jvm/java-{java_version}-openjdk-amd64/"
 
+        # set when target/dependency links into the dependency cache
+        dir_dependency_link = None
         if bug_info[self.key_build_system] == "maven":
-            # compile main + test classes so Flacoco can see target/test-classes
-            mvn_skip = (
-                "-Dcheckstyle.skip=true -Denforcer.skip=true -Dspotbugs.skip=true "
-                "-Dforbiddenapis.skip=true -Dlicense.skip=true -DskipITs"
+            mvn_skip = self.maven_skip_plugins
+            # put deps under target/dependency, through the dependency cache shared
+            # by all bugs of the same project when it is enabled
+            dir_dependency = join(base_path, "target", "dependency")
+            dir_dependency_cache = (
+                self.get_maven_dependency_cache_dir(base_path, project_name)
+                if task_config_info.get(self.key_dependency_cache, False)
+                else None
             )
-            self.run_command(
-                f"mvn -q {mvn_skip} -DskipTests=false -DfailIfNoTests=false test-compile",
-                dir_path=base_path,
-                env=env,
+            dir_dependency_staging = None
+            log_dependency_path = join(
+                self.dir_logs, f"{self.name}-mvn-dependencies.log"
             )
-            # put deps under target/dependency
-            self.run_command(
-                "mvn -q dependency:copy-dependencies -DoutputDirectory=target/dependency",
+            maven_commands = [
+                # compile main + test classes so Flacoco can see target/test-classes
+                (
+                    f"mvn -q {mvn_skip} -DskipTests=false -DfailIfNoTests=false test-compile",
+                    join(self.dir_logs, f"{self.name}-mvn-compile.log"),
+                ),
+            ]
+            if dir_dependency_cache and self.is_maven_dependency_cache_complete(
+                dir_dependency_cache
+            ):
+                self.emit_normal(
+                    f"[repairllama] reusing cached maven dependencies from {dir_dependency_cache}"
+                )
+            else:
+                if dir_dependency_cache:
+                    dir_dependency_staging = self.get_maven_dependency_staging_dir(
+                        dir_dependency_cache
+                    )
+                maven_commands.append(
+                    (
+                        "mvn -q dependency:copy-dependencies -DoutputDirectory={}".format(
+                            dir_dependency_staging or "target/dependency"
+                        ),
+                        log_dependency_path,
+                    )
+                )
+            maven_status = self.run_commands(
+                maven_commands,
                 dir_path=base_path,
                 env=env,
+                parallel=task_config_info.get(self.key_parallel_build, False),
             )
-        
+            if (
+                dir_dependency_cache
+                and dir_dependency_staging
+                and not self.complete_maven_dependency_cache(
+                    dir_dependency_staging, dir_dependency_cache, maven_status[-1]
+                )
+            ):
+                # copy into the project as if the cache was disabled
+                self.run_command(
+                    "mvn -q dependency:copy-dependencies -DoutputDirectory=target/dependency",
+                    log_file_path=log_dependency_path,
+                    dir_path=base_path,
+                    env=env,
+                )
+                dir_dependency_cache = None
+            if dir_dependency_cache:
+                link_script = (
+                    'rm -rf "$1" && mkdir -p "$(dirname "$1")" && ln -s "$2" "$1"'
+                )
+                self.run_command(
+                    shlex.join(
+                        [
+                            "bash",
+                            "-c",
+                            link_script,
+                            "_",
+                            dir_dependency,
+                            dir_dependency_cache,
+                        ]
+                    ),
+                    dir_path=base_path,
+                )
+                dir_dependency_link = dir_dependency
 
         # Replace main.py in the current working directory with repairllama_main.py from setup directory
         src_main_py = join(self.dir_setup, "repairllama_main.py")
@@ -105,4 +170,8 @@ class RepairLlama(AbstractRepairTool):
             else:
                 self.emit_warning(f"[repairllama] verifier script not found at {verify_script}")
 
+        # the link dangles on the host, do not leave it in the experiment folder
+        if dir_dependency_link:
+            self.run_command(shlex.join(["rm", "-f", dir_dependency_link]))
+
         self.timestamp_log_end()
\ No newline at end of file